@@ -27,37 +27,60 @@
 
 
 import time
+import math
 import threading
-import queue
-import re
-from datetime import datetime
+from collections import deque
 import csv
+import tempfile
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
 
+import numpy as np
 import serial
 from serial.tools import list_ports
 
-import matplotlib
-matplotlib.use("TkAgg")
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-
 APP_TITLE = "Dragonfly Neutron - Rev.02 - Nucleon Power, Inc. (c) 2025"
 BAUD = 115200
 HV_MIN, HV_MAX, HV_STEP = 0, 1500, 15
 WINDOW_SECONDS = 60                  # show the last 60 s (scrolling)
+XLIM_STEP = 1.0                      # x limits scroll in whole steps (s)
 READ_TIMEOUT = 0.1                   # serial read timeout
+READ_CHUNK = 4096                    # > one READ_TIMEOUT worth of bytes at BAUD
+MAX_PARTIAL = 1024                   # unterminated bytes kept before dropping as noise
 CURRENT_YMIN, CURRENT_YMAX = 0, 250  # fixed current (µA) axis
+DRAIN_MAX = 5000                     # samples ingested per poll; rest wait a tick
+POLL_MS = 100                        # queue drain interval
+REDRAW_INTERVAL = 0.2                # seconds between plot redraws; a multiple of POLL_MS
+MAX_RETAIN = 1_000_000               # up to this many CSV log rows in RAM; older rows spill to a temp file
 
-# {TIMEPLOT|DATA|C|T|0} etc.
-TIMEPLOT_RE = re.compile(r"\{TIMEPLOT\|DATA\|([CIV])\|T\|(-?\d+(?:\.\d+)?)\}")
+# {TIMEPLOT|DATA|C|T|0} etc. -- fixed layout, so fields are checked by offset:
+# prefix [0:15], series byte [15], "|T|" [16:19], value [19:-1], "}" [-1]
+TIMEPLOT_PREFIX = b"{TIMEPLOT|DATA|"
+TIMEPLOT_MIN_LEN = len(b"{TIMEPLOT|DATA|C|T|0}")
+SERIES_BY_BYTE = {ord("C"): "C", ord("I"): "I", ord("V"): "V"}
 
 def list_serial_ports():
     return [p.device for p in list_ports.comports()]
 
+def decimate_minmax(x, y, bins: int):
+    """Reduce (x, y) to the min and max sample of each of `bins` bins.
+
+    Keeps spikes visible while capping the points handed to the renderer;
+    the trailing partial bin (the newest data) is passed through as-is.
+    """
+    n = len(x)
+    if n <= 2 * bins:
+        return x, y
+    size = n // bins
+    m = size * bins
+    starts = np.arange(0, m, size)
+    yb = y[:m].reshape(bins, size)
+    idx = np.sort(np.concatenate((starts + yb.argmin(axis=1), starts + yb.argmax(axis=1))))
+    idx = np.concatenate((idx, np.arange(m, n)))
+    return x[idx], y[idx]
+
 class SerialReader(threading.Thread):
-    def __init__(self, ser: serial.Serial, out_queue: queue.Queue, stop_event: threading.Event):
+    def __init__(self, ser: serial.Serial, out_queue: deque, stop_event: threading.Event):
         super().__init__(daemon=True)
         self.ser = ser
         self.out_queue = out_queue
@@ -68,27 +91,199 @@ class SerialReader(threading.Thread):
         try:
             while not self.stop_event.is_set():
                 try:
-                    data = self.ser.read(1024)
+                    # Block until READ_CHUNK bytes or READ_TIMEOUT, but take the
+                    # whole backlog in one call if more is already waiting
+                    data = self.ser.read(max(READ_CHUNK, self.ser.in_waiting))
                     if not data:
                         continue
-                    self.buffer.extend(data)
-                    while b"\n" in self.buffer:
-                        line, _, rest = self.buffer.partition(b"\n")
-                        self.buffer = rest
-                        txt = line.decode("ascii", errors="ignore").strip()
-                        if txt:
-                            self._parse_line(txt)
-                except serial.SerialException:
+                    ts = time.time()  # timestamp as received, shared by this read
+                    buf = self.buffer
+                    buf.extend(data)
+                    # Split every complete line in one C pass, then drop them
+                    # from the buffer in place, keeping any partial tail
+                    end = buf.rfind(b"\n")
+                    lines = bytes(buf[:end]).split(b"\n") if end >= 0 else []
+                    del buf[:end + 1]
+                    if len(buf) > MAX_PARTIAL:
+                        buf.clear()
+                    # Collect every sample from this read, then hand off in one go
+                    batch = []
+                    for line in lines:
+                        line = line.strip()
+                        if line:
+                            sample = self._parse_line(line, ts)
+                            if sample:
+                                batch.append(sample)
+                    if batch:
+                        self.out_queue.extend(batch)
+                # in_waiting is a bare ioctl on POSIX: an unplugged adapter
+                # raises OSError there rather than SerialException
+                except (serial.SerialException, OSError):
                     break
         finally:
             pass
 
-    def _parse_line(self, line: str):
-        m = TIMEPLOT_RE.fullmatch(line)
-        if m:
-            series, value = m.group(1), float(m.group(2))
-            ts = time.time()  # timestamp as received
-            self.out_queue.put((series, value, ts))
+    def _parse_line(self, line: bytes, ts: float):
+        # Slices and startswith() on the raw bytes; nothing is decoded
+        if (len(line) < TIMEPLOT_MIN_LEN or not line.startswith(TIMEPLOT_PREFIX)
+                or line[16:19] != b"|T|" or not line.endswith(b"}")):
+            return None
+        series = SERIES_BY_BYTE.get(line[15])
+        if series is None:
+            return None
+        try:
+            value = float(line[19:-1])  # float() accepts ASCII bytes
+        except ValueError:
+            return None
+        if not math.isfinite(value):    # float() also takes "nan"/"inf"
+            return None
+        return series, value, ts
+
+class SeriesBuffer:
+    """One plot series as float64 columns (t_rel, value) over a sliding window.
+
+    Points before ``start`` have scrolled out of view; their slots are
+    reclaimed when the arrays fill up, so memory follows the window length
+    rather than the session length.
+    """
+
+    def __init__(self, capacity: int = 4096):
+        self.t = np.empty(capacity)
+        self.y = np.empty(capacity)
+        self.start = 0
+        self.n = 0
+        self.dirty = False  # new points since the line was last updated
+
+    def __len__(self):
+        return self.n - self.start
+
+    def extend(self, t, y):
+        k = len(t)
+        if self.n + k > len(self.t):
+            self._compact(k)
+        self.t[self.n:self.n + k] = t
+        self.y[self.n:self.n + k] = y
+        self.n += k
+        self.dirty = True
+
+    def _compact(self, k: int):
+        # Move the live window to the front; grow only if it would leave
+        # less than half the arrays free
+        live = self.n - self.start
+        if 2 * (live + k) > len(self.t):
+            capacity = max(2 * len(self.t), 2 * (live + k))
+            t, y = np.empty(capacity), np.empty(capacity)
+        else:
+            t, y = self.t, self.y
+        t[:live] = self.t[self.start:self.n]
+        y[:live] = self.y[self.start:self.n]
+        self.t, self.y = t, y
+        self.start, self.n = 0, live
+
+    def last_t(self):
+        return self.t[self.n - 1]
+
+    def window(self, xmin: float):
+        """Drop points older than xmin and return the rest as (t, y) views."""
+        # t_rel is monotonic, so the cut is one binary search
+        self.start += np.searchsorted(self.t[self.start:self.n], xmin)
+        return self.t[self.start:self.n], self.y[self.start:self.n]
+
+    def clear(self):
+        self.start = self.n = 0
+        self.dirty = True
+
+class WideLog:
+    """Wide CSV snapshots as float64 columns (ts, Counts, Voltage, Current).
+
+    Values not seen yet are NaN; timestamps are only formatted on export.
+    Past `max_retain` rows, the oldest half is appended to an anonymous temp
+    file as raw float64 records, so memory stays flat on long runs. If that
+    write fails, `spill_error` is set and rows stay in memory from then on.
+    """
+
+    def __init__(self, capacity: int = 16384, max_retain: int = MAX_RETAIN):
+        self.cols = np.empty((4, capacity))
+        self.n = 0
+        self.max_retain = max_retain
+        self._spill = None
+        self._spilled = 0
+        self.spill_error = None
+
+    def __len__(self):
+        return self._spilled + self.n
+
+    def extend(self, rows):
+        """Append (ts, Counts, Voltage, Current) rows."""
+        k = len(rows)
+        if self.n + k > self.cols.shape[1]:
+            cols = np.empty((4, max(2 * self.cols.shape[1], self.n + k)))
+            cols[:, :self.n] = self.cols[:, :self.n]
+            self.cols = cols
+        self.cols[:, self.n:self.n + k] = np.array(rows, dtype=np.float64).T
+        self.n += k
+        if self.n > self.max_retain and self.spill_error is None:
+            self._spill_oldest(self.n - self.max_retain // 2)
+
+    def _spill_oldest(self, k: int):
+        try:
+            if self._spill is None:
+                self._spill = tempfile.TemporaryFile()
+            # Write after the last complete record, over any partial one a
+            # failed attempt may have left
+            self._spill.seek(self._spilled * 4 * 8)
+            self._spill.write(self.cols[:, :k].T.tobytes())
+            self._spill.flush()
+        except OSError as e:
+            # Disk full / no temp dir: keep the rows in memory, don't retry
+            self.spill_error = e
+            return
+        self._spilled += k
+        # k > n/2 here, so the kept tail never overlaps its new position
+        self.cols[:, :self.n - k] = self.cols[:, k:self.n]
+        self.n -= k
+
+    def write_rows(self, w, t0: float, chunk: int = 65536):
+        """Write rows (iso_ts, t_rel, Counts, Voltage, Current) to csv writer `w`.
+
+        Columns are prepared with numpy `chunk` rows at a time (timestamps,
+        t_rel, NaN -> ""); the float-to-text step stays in csv's C writer,
+        which is faster at repr() than numpy's astype(str).
+        """
+        for cols in self._chunks(chunk):
+            vals = cols[1:].astype(object)
+            vals[np.isnan(cols[1:])] = ""
+            w.writerows(zip(self._iso_stamps(cols[0]).tolist(), (cols[0] - t0).tolist(), *vals.tolist()))
+
+    def _chunks(self, chunk: int):
+        # Spilled prefix first (read back from disk), then the in-memory tail
+        if self._spill is not None:
+            self._spill.seek(0)
+            for start in range(0, self._spilled, chunk):
+                data = self._spill.read(min(chunk, self._spilled - start) * 4 * 8)
+                yield np.frombuffer(data, dtype=np.float64).reshape(-1, 4).T
+        for start in range(0, self.n, chunk):
+            yield self.cols[:, start:min(start + chunk, self.n)]
+
+    @staticmethod
+    def _iso_stamps(ts):
+        # Same rounding as datetime.fromtimestamp(): fraction to whole us
+        frac, whole = np.modf(ts)
+        us = np.round(frac * 1e6)
+        whole = whole + (us >= 1e6)
+        ms = ((us % 1e6) // 1000).astype(np.int64)
+        # Local time is formatted once per distinct second, not per row
+        secs, idx = np.unique(whole, return_inverse=True)
+        stamps = np.array([time.strftime("%Y-%m-%dT%H:%M:%S.", time.localtime(s)) for s in secs.tolist()])
+        return np.char.add(stamps[idx], np.char.zfill(ms.astype(str), 3))
+
+    def clear(self):
+        self.n = 0
+        if self._spill is not None:
+            self._spill.close()  # temp file is deleted on close
+            self._spill = None
+        self._spilled = 0
+        self.spill_error = None
 
 class DragonflyGUI(tk.Tk):
     def __init__(self):
@@ -101,23 +296,28 @@ class DragonflyGUI(tk.Tk):
         self.ser = None
         self.reader_thread = None
         self.stop_event = threading.Event()
-        self.data_queue = queue.Queue()
+        self._last_sent_hv = None  # last setpoint written on this connection
+        # deque append/extend/popleft are atomic: single producer, single consumer
+        self.data_queue = deque()
 
-        # Data (retain everything for CSV, wide format)
+        # Data (retain everything for CSV, wide format; see MAX_RETAIN)
         self.t0 = time.time()
-        self.C_t, self.C_y = [], []
-        self.I_t, self.I_y = [], []
-        self.V_t, self.V_y = [], []
+        self.C_buf = SeriesBuffer()
+        self.I_buf = SeriesBuffer()
+        self.V_buf = SeriesBuffer()
+        self._series = {"C": self.C_buf, "I": self.I_buf, "V": self.V_buf}
 
         # last-known values for wide CSV snapshot
-        self.last_counts = None
-        self.last_voltage = None
-        self.last_current = None
-        # rows: (iso_ts, t_rel, Counts, Voltage, Current)
-        self.data_wide_log = []
+        self._last = dict.fromkeys("CIV", np.nan)
+        # Peak of the visible counts and its t_rel, for the counts y range
+        self._c_peak, self._c_peak_t = 0.0, math.inf
+        self.data_wide_log = WideLog()
 
         self._build_ui()
-        self.after(100, self._poll_queue)
+        # Give Tk a moment to map and paint the window before the plot import
+        self.after(50, self._build_plot)
+        self._last_redraw = 0.0
+        self.after(POLL_MS, self._poll_queue)
 
     # ---------- UI ----------
     def _build_ui(self):
@@ -146,22 +346,43 @@ class DragonflyGUI(tk.Tk):
         self.hv_spin = ttk.Spinbox(hv, from_=HV_MIN, to=HV_MAX, increment=HV_STEP,
                                    textvariable=self.hv_var, width=10, command=self._send_hv_from_spin)
         self.hv_spin.pack(side=tk.LEFT)
-        ttk.Button(hv, text="Send", command=self._send_hv_from_spin).pack(side=tk.LEFT, padx=(8, 0))
+        ttk.Button(hv, text="Send", command=lambda: self._send_hv_from_spin(force=True)).pack(side=tk.LEFT, padx=(8, 0))
 
         # Data group (CSV)
         data = ttk.LabelFrame(row1, text="Data", padding=8)
         data.pack(side=tk.LEFT, padx=10)
         ttk.Button(data, text="Export CSV", command=self._export_csv).pack(side=tk.LEFT)
+        self.log_var = tk.BooleanVar(value=True)
+        ttk.Checkbutton(data, text="Log to CSV", variable=self.log_var).pack(side=tk.LEFT, padx=(8, 0))
 
         # Right-aligned status (last message only)
         self.status_var = tk.StringVar(value="Disconnected")
         ttk.Label(row1, textvariable=self.status_var).pack(side=tk.RIGHT)
 
-        # Plot area
-        plot_frame = ttk.Frame(self, padding=8)
-        plot_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        # Plot area; the figure is built by _build_plot once the window is up
+        self.plot_frame = ttk.Frame(self, padding=8)
+        self.plot_frame.pack(side=tk.TOP, fill=tk.BOTH, expand=True)
+        self.plot_placeholder = ttk.Label(self.plot_frame, text="Loading plot...")
+        self.plot_placeholder.pack(expand=True)
+        self.canvas = None
 
-        fig = Figure(figsize=(6, 4), dpi=100)
+        # Light theme if present
+        try:
+            style = ttk.Style(self)
+            if "clam" in style.theme_names():
+                style.theme_use("clam")
+        except Exception:
+            pass
+
+    def _build_plot(self):
+        # matplotlib is imported here rather than at the top: the import is
+        # the slowest part of startup, and this way the controls show first
+        import matplotlib
+        matplotlib.use("TkAgg")
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+        self.fig = fig = Figure(figsize=(6, 4), dpi=100)
         # Make room on the right for the extra axis
         fig.subplots_adjust(right=0.82)
 
@@ -183,10 +404,11 @@ class DragonflyGUI(tk.Tk):
         self.ax_i.patch.set_visible(False)
         self.ax_c.spines["right"].set_visible(True)
 
-        # Lines with requested colors
-        self.line_v, = self.ax_v.plot([], [], color="green", label="V (Volts)")
-        self.line_c, = self.ax_c.plot([], [], color="red",   label="C (CPS)")
-        self.line_i, = self.ax_i.plot([], [], color="blue",  label="I (µA)")
+        # Lines with requested colors; animated so full draws leave them out
+        # of the cached background and they can be blitted on their own
+        self.line_v, = self.ax_v.plot([], [], color="green", label="V (Volts)", animated=True)
+        self.line_c, = self.ax_c.plot([], [], color="red",   label="C (CPS)", animated=True)
+        self.line_i, = self.ax_i.plot([], [], color="blue",  label="I (µA)", animated=True)
 
         # Color-code the y-axes
         self.ax_v.yaxis.label.set_color("green")
@@ -204,16 +426,18 @@ class DragonflyGUI(tk.Tk):
         labels = [h.get_label() for h in handles]
         self.ax_v.legend(handles, labels, loc="upper left")
 
-        self.canvas = FigureCanvasTkAgg(fig, master=plot_frame)
+        self.plot_placeholder.destroy()
+        self.canvas = FigureCanvasTkAgg(fig, master=self.plot_frame)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
 
-        # Light theme if present
-        try:
-            style = ttk.Style(self)
-            if "clam" in style.theme_names():
-                style.theme_use("clam")
-        except Exception:
-            pass
+        # Blitting: every full draw (limits change, resize) re-captures the
+        # static background; in between only the three lines are redrawn
+        self._bg = None
+        self._limits = None
+        self._xlim = None
+        self._c_top = None
+        self.canvas.mpl_connect("draw_event", self._on_draw)
+        self._redraw()
 
     def _refresh_ports(self):
         ports = list_serial_ports()
@@ -259,124 +483,174 @@ class DragonflyGUI(tk.Tk):
             except Exception:
                 pass
             self.ser = None
+        self._last_sent_hv = None
+        self._flush()
         self._set_status("Disconnected")
         self.connect_btn.configure(state=tk.NORMAL)
         self.disconnect_btn.configure(state=tk.DISABLED)
 
     # ---------- HV send ----------
-    def _send_hv_from_spin(self):
+    def _send_hv_from_spin(self, force: bool = False):
         val = int(self.hv_var.get())
-        val = max(HV_MIN, min(HV_MAX, val))
-        self.hv_var.set(val)
-        self._send_hv(val)
+        clamped = max(HV_MIN, min(HV_MAX, val))
+        if clamped != val:
+            self.hv_var.set(clamped)
+        # Arrow clicks at a limit repeat the same setpoint; Send always goes out
+        if clamped == self._last_sent_hv and not force:
+            return
+        self._send_hv(clamped)
 
     def _send_hv(self, val: int):
         if not (self.ser and self.ser.is_open):
             self._set_status("Not connected; command not sent.")
             return
-        cmd = f"!SetHV {val}\r\n"
+        cmd = b"!SetHV %d\r\n" % val
         try:
-            self.ser.write(cmd.encode("ascii"))
-            self._set_status(f"Sent: {cmd.strip()}")
+            self.ser.write(cmd)
+            self._last_sent_hv = val
+            self._set_status(f"Sent: {cmd.decode('ascii').strip()}")
         except Exception as e:
             self._set_status(f"Send error: {e}")
 
     # ---------- Data / Plot ----------
     def _reset_series(self):
         self.t0 = time.time()
-        self.C_t.clear(); self.C_y.clear()
-        self.I_t.clear(); self.I_y.clear()
-        self.V_t.clear(); self.V_y.clear()
-        self.last_counts = None
-        self.last_voltage = None
-        self.last_current = None
+        for buf in self._series.values():
+            buf.clear()
+        self._last = dict.fromkeys("CIV", np.nan)
+        # Peak of the visible counts and its t_rel, for the counts y range
+        self._c_peak, self._c_peak_t = 0.0, math.inf
         self.data_wide_log.clear()
         self._redraw()
 
     def _poll_queue(self):
-        updated = False
+        q = self.data_queue
         try:
-            while True:
-                series, value, ts = self.data_queue.get_nowait()
-                t_rel = ts - self.t0
-                iso_ts = datetime.fromtimestamp(ts).isoformat(timespec="milliseconds")
-
-                # Update plots + last-known values
-                if series == "C":
-                    self.C_t.append(t_rel); self.C_y.append(value)
-                    self.last_counts = value
-                elif series == "I":
-                    self.I_t.append(t_rel); self.I_y.append(value)
-                    self.last_current = value
-                elif series == "V":
-                    self.V_t.append(t_rel); self.V_y.append(value)
-                    self.last_voltage = value
-
-                # Wide CSV snapshot (carry-forward latest values)
-                self.data_wide_log.append((
-                    iso_ts,
-                    t_rel,
-                    self.last_counts if self.last_counts is not None else "",
-                    self.last_voltage if self.last_voltage is not None else "",
-                    self.last_current if self.last_current is not None else "",
-                ))
-
-                updated = True
-        except queue.Empty:
-            pass
-
-        if updated:
-            self._redraw()
-
-        self.after(100, self._poll_queue)
+            batch = [q.popleft() for _ in range(min(len(q), DRAIN_MAX))]
+            if batch:
+                self._ingest(batch)
+
+            # Drain at POLL_MS for latency, but redraw every REDRAW_INTERVAL; the
+            # check only runs on poll ticks, so allow half a tick of timer jitter
+            if (time.monotonic() - self._last_redraw >= REDRAW_INTERVAL - POLL_MS / 2000
+                    and any(buf.dirty for buf in self._series.values())):
+                self._redraw()
+        finally:
+            # Re-arm even if this batch raised, so one error can't stop the loop;
+            # come back sooner while a burst is still queued
+            self.after(10 if q else POLL_MS, self._poll_queue)
+
+    def _flush(self):
+        # Ingest everything still queued and bring the plot up to date now
+        q = self.data_queue
+        if q:
+            self._ingest([q.popleft() for _ in range(len(q))])
+        self._redraw()
 
-    def _slice_window(self, t_list, y_list, xmin):
-        if not t_list:
-            return [], []
-        i0 = 0
-        for idx in range(len(t_list)-1, -1, -1):
-            if t_list[idx] < xmin:
-                i0 = idx + 1
-                break
-        return t_list[i0:], y_list[i0:]
+    def _ingest(self, batch):
+        # Gather per series in plain lists, then copy into the arrays once
+        pending = {k: ([], []) for k in self._series}
+        rows = []
+        last = self._last
+        log = self.log_var.get()
+        for series, value, ts in batch:
+            t_list, y_list = pending[series]
+            t_list.append(ts)
+            y_list.append(value)
+            last[series] = value
+
+            # Wide CSV snapshot (carry-forward latest values)
+            if log:
+                rows.append((ts, last["C"], last["V"], last["I"]))
+
+        for series, (t_list, y_list) in pending.items():
+            if t_list:
+                self._series[series].extend(np.array(t_list) - self.t0, y_list)
+        if rows:
+            wide = self.data_wide_log
+            spilling = wide.spill_error is None
+            wide.extend(rows)
+            if spilling and wide.spill_error is not None:
+                self._set_status(f"Temp file error, keeping CSV log in memory: {wide.spill_error}")
+
+        c_t, c_y = pending["C"]
+        if c_y:
+            peak = max(c_y)
+            if peak >= self._c_peak:
+                self._c_peak, self._c_peak_t = peak, c_t[c_y.index(peak)] - self.t0
 
     def _redraw(self):
+        if self.canvas is None:
+            return  # plot not built yet; the buffers keep filling meanwhile
+
         # X limits: last 60 s (scrolling)
         xmax_candidates = []
-        if self.C_t: xmax_candidates.append(self.C_t[-1])
-        if self.I_t: xmax_candidates.append(self.I_t[-1])
-        if self.V_t: xmax_candidates.append(self.V_t[-1])
+        if self.C_buf: xmax_candidates.append(self.C_buf.last_t())
+        if self.I_buf: xmax_candidates.append(self.I_buf.last_t())
+        if self.V_buf: xmax_candidates.append(self.V_buf.last_t())
         if xmax_candidates:
-            xmax = max(xmax_candidates)
+            # Snap the right edge up to a whole step: the limits, and with
+            # them the ticks and the blit background, change once per step
+            xmax = math.ceil(max(xmax_candidates) / XLIM_STEP) * XLIM_STEP
             xmin = max(0.0, xmax - WINDOW_SECONDS)
         else:
             xmin, xmax = 0.0, WINDOW_SECONDS
 
-        # Windowed data for display (full data retained)
-        Vx, Vy = self._slice_window(self.V_t, self.V_y, xmin)
-        Cx, Cy = self._slice_window(self.C_t, self.C_y, xmin)
-        Ix, Iy = self._slice_window(self.I_t, self.I_y, xmin)
-
-        self.line_v.set_data(Vx, Vy)
-        self.line_c.set_data(Cx, Cy)
-        self.line_i.set_data(Ix, Iy)
-
-        # X range (scroll)
-        self.ax_v.set_xlim(xmin, max(xmin + 10, xmax))
-
-        # Voltage fixed 0–1500 (no autoscale)
-        self.ax_v.set_ylim(0, 1500)
-
-        # Counts autoscale
-        self.ax_c.relim(); self.ax_c.autoscale_view(scalex=False, scaley=True)
+        # Windowed data for display (older points are dropped; the CSV log keeps all).
+        # Series without new points keep their line: anything that scrolled
+        # out is clipped by the x limits anyway.
+        bins = max(1, int(self.ax_v.bbox.width))
+        for buf, line in ((self.V_buf, self.line_v), (self.C_buf, self.line_c), (self.I_buf, self.line_i)):
+            x, y = buf.window(xmin)
+            if buf.dirty:
+                # No more than one min/max pair per horizontal pixel reaches Agg
+                line.set_data(*decimate_minmax(x, y, bins))
+                buf.dirty = False
+
+        # X range (scroll); Voltage and Current y ranges are fixed in _build_plot
+        xlim = (xmin, max(xmin + 10, xmax))
+        if xlim != self._xlim:
+            self.ax_v.set_xlim(*xlim)
+            self._xlim = xlim
+
+        # Counts autoscale from the tracked peak; the window is only rescanned
+        # when the peak itself has scrolled out of view
+        if self._c_peak_t < xmin:
+            t, y = self.C_buf.window(xmin)
+            if len(y):
+                i = int(y.argmax())
+                self._c_peak, self._c_peak_t = float(y[i]), float(t[i])
+            else:
+                self._c_peak, self._c_peak_t = 0.0, math.inf
+        c_top = self._c_peak * 1.1 if self._c_peak > 0 else 1.0
+        if c_top != self._c_top:
+            self.ax_c.set_ylim(0, c_top)
+            self._c_top = c_top
+
+        limits = (xlim, c_top)
+        if self._bg is None or limits != self._limits:
+            # Axes changed: full redraw, _on_draw grabs the new background
+            self._limits = limits
+            self._bg = None
+            self.canvas.draw_idle()
+        else:
+            self.canvas.restore_region(self._bg)
+            self._draw_lines()
+            self.canvas.blit(self.fig.bbox)
+        # Stamped after drawing, so a slow draw doesn't eat into the next interval
+        self._last_redraw = time.monotonic()
 
-        # Current axis fixed
-        self.ax_i.set_ylim(CURRENT_YMIN, CURRENT_YMAX)
+    def _on_draw(self, event):
+        self._bg = self.canvas.copy_from_bbox(self.fig.bbox)
+        self._draw_lines()
 
-        self.canvas.draw_idle()
+    def _draw_lines(self):
+        for line in (self.line_v, self.line_c, self.line_i):
+            line.axes.draw_artist(line)
 
     # ---------- CSV export ----------
     def _export_csv(self):
+        self._flush()
         if not self.data_wide_log:
             messagebox.showinfo("Export CSV", "No data to export yet.")
             return
@@ -392,7 +666,7 @@ class DragonflyGUI(tk.Tk):
                 w = csv.writer(f)
                 # exact header order requested
                 w.writerow(["timestamp_iso", "t_rel_seconds", "Counts", "Voltage", "Current"])
-                w.writerows(self.data_wide_log)
+                self.data_wide_log.write_rows(w, self.t0)
             self._set_status(f"Saved CSV: {fname}")
         except Exception as e:
             messagebox.showerror("Export error", f"Couldn't write file:\n{e}")